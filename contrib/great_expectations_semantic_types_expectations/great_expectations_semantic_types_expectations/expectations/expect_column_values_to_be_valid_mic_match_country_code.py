@@ -3,8 +3,10 @@ This is a template for creating custom ColumnMapExpectations.
 For detailed instructions on how to use it, please see:
     https://docs.greatexpectations.io/docs/guides/expectations/creating_custom_expectations/how_to_create_custom_column_map_expectations
 """
-from typing import Optional
+import functools
+from typing import Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
@@ -16,20 +18,6 @@ from great_expectations.expectations.metrics import (
 )
 
 
-def is_valid_mic_match_country_code(mic: str, country_code, df) -> bool:
-    try:
-        if mic.upper() in df["MIC"].unique():
-            cc = df.loc[df["MIC"] == mic.upper()]["ISO COUNTRY CODE (ISO 3166)"].iloc[0]
-            if country_code.upper() == cc[0:2]:
-                return True
-            else:
-                return False
-        else:
-            return False
-    except Exception:
-        return False
-
-
 # This class defines a Metric to support your Expectation.
 # For most ColumnMapExpectations, the main business logic for calculation will live in this class.
 class ColumnValuesToBeValidMicMatchCountryCode(ColumnMapMetricProvider):
@@ -39,14 +27,49 @@ class ColumnValuesToBeValidMicMatchCountryCode(ColumnMapMetricProvider):
     condition_value_keys = ("country_code",)
 
     url = "https://www.iso20022.org/sites/default/files/ISO10383_MIC/ISO10383_MIC.csv"
-    df = pd.read_csv(url, encoding="cp1250")
+
+    @classmethod
+    def mic_country_code_lookup(
+        cls,
+    ) -> Tuple[pd.CategoricalDtype, pd.Index, np.ndarray]:
+        """Returns the MIC categories, the distinct two-letter ISO 3166 country codes, and an int16 array holding,
+        for each MIC category code, the position of its country code; parsed once per process on first use."""
+        lookup = cls._load_mic_country_code_lookup()
+        if isinstance(lookup, Exception):
+            raise RuntimeError(
+                f"Unable to load the ISO 10383 MIC list from {cls.url}; validating MICs requires network access."
+            ) from lookup
+
+        return lookup
+
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _load_mic_country_code_lookup(
+        cls,
+    ) -> Union[Tuple[pd.CategoricalDtype, pd.Index, np.ndarray], Exception]:
+        # A failed download is returned (and thus cached) rather than raised, so that it is attempted only once.
+        try:
+            df = pd.read_csv(cls.url, encoding="cp1250")
+        except (OSError, ValueError) as e:
+            return e
+
+        # The first row listed for a MIC determines its country code.
+        df = df.assign(MIC=df["MIC"].astype(str).str.upper()).drop_duplicates("MIC")
+        mic_dtype = pd.CategoricalDtype(df["MIC"])
+        mic_country_codes, country_codes = pd.factorize(
+            df["ISO COUNTRY CODE (ISO 3166)"].astype(str).str[:2].str.upper()
+        )
+        return mic_dtype, pd.Index(country_codes), mic_country_codes.astype(np.int16)
 
     # This method implements the core logic for the PandasExecutionEngine
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, country_code, **kwargs):
-        return column.apply(
-            lambda x: is_valid_mic_match_country_code(x, country_code, cls.df)
-        )
+        mic_dtype, country_codes, mic_country_codes = cls.mic_country_code_lookup()
+        target = country_codes.get_indexer([country_code.upper()])[0]
+        codes = pd.Categorical(column.astype(str).str.upper(), dtype=mic_dtype).codes
+        # Unknown MICs get code -1; mask them out before comparing country code positions.
+        matches = (codes >= 0) & (mic_country_codes[codes] == target)
+        return pd.Series(matches, index=column.index)
 
     # This method defines the business logic for evaluating your metric when using a SqlAlchemyExecutionEngine
     # @column_condition_partial(engine=SqlAlchemyExecutionEngine)
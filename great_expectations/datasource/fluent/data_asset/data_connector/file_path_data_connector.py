@@ -314,12 +314,8 @@ batch identifiers {batch_definition.batch_identifiers} from batch definition {ba
         Returns:
             Potentially modified Regular Expression pattern (with enclosing FILE_PATH_BATCH_SPEC_KEY reserved group)
         """
-        regex_parser = RegExParser(
-            regex_pattern=regex,
-            unnamed_regex_group_prefix=self._unnamed_regex_group_prefix,
-        )
-        group_names: List[str] = regex_parser.get_all_group_names()
-        if FilePathDataConnector.FILE_PATH_BATCH_SPEC_KEY not in group_names:
+        # Reserved group name can only be a named group; hence, compiled pattern's "groupindex" suffices for the check.
+        if FilePathDataConnector.FILE_PATH_BATCH_SPEC_KEY not in regex.groupindex:
             pattern: str = regex.pattern
             pattern = f"(?P<{FilePathDataConnector.FILE_PATH_BATCH_SPEC_KEY}>{pattern})"
             regex = re.compile(pattern)
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import logging
 import pathlib
-from typing import TYPE_CHECKING, ClassVar, Optional, Type
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, ClassVar, List, Optional, Type
 
 from typing_extensions import Literal
 
@@ -23,6 +24,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Testing assets is I/O bound (filesystem "stat" and "glob" calls); hence, assets are tested on multiple threads.
+MAX_TEST_CONNECTION_WORKERS: int = 32
+
 
 @public_api
 class SparkFilesystemDatasource(_SparkFilePathDatasource):
@@ -44,7 +48,7 @@ class SparkFilesystemDatasource(_SparkFilePathDatasource):
             test_assets: If assets have been passed to the SparkDatasource, whether to test them as well.
 
         Raises:
-            TestConnectionError: If the connection test fails.
+            TestConnectionError: If the connection test fails; if several assets fail, their messages are combined.
         """
         if not self.base_directory.exists():
             raise TestConnectionError(
@@ -52,8 +56,30 @@ class SparkFilesystemDatasource(_SparkFilePathDatasource):
             )
 
         if self.assets and test_assets:
-            for asset in self.assets:
-                asset.test_connection()
+            if len(self.assets) == 1:
+                self.assets[0].test_connection()
+                return
+
+            test_connection_errors: List[TestConnectionError] = []
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_TEST_CONNECTION_WORKERS, len(self.assets))
+            ) as executor:
+                futures = [
+                    executor.submit(asset.test_connection) for asset in self.assets
+                ]
+                for future in futures:
+                    try:
+                        future.result()
+                    except TestConnectionError as e:
+                        test_connection_errors.append(e)
+
+            if len(test_connection_errors) == 1:
+                raise test_connection_errors[0]
+
+            if test_connection_errors:
+                raise TestConnectionError(
+                    "\n".join(str(e) for e in test_connection_errors)
+                )
 
     def _build_data_connector(
         self, data_asset: CSVAsset, glob_directive: str = "**/*", **kwargs
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import itertools
 import logging
 import traceback
+from collections import deque
 from typing import (
     TYPE_CHECKING,
     Callable,
+    Deque,
     Dict,
+    Iterable,
     List,
     Optional,
     Set,
@@ -14,8 +18,6 @@ from typing import (
     cast,
 )
 
-from tqdm.auto import tqdm
-
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.core import IDDict  # noqa: TCH001
 from great_expectations.core.expectation_configuration import (
@@ -30,6 +32,8 @@ from great_expectations.validator.metric_configuration import (
 )
 
 if TYPE_CHECKING:
+    from tqdm.auto import tqdm
+
     from great_expectations.expectations.metrics.metric_provider import MetricProvider
 
 logger = logging.getLogger(__name__)
@@ -39,11 +43,23 @@ MAX_METRIC_COMPUTATION_RETRIES: int = 3
 
 
 class MetricEdge:
+    # One "MetricEdge" exists per metric dependency; slots keep these numerous objects small and fast to traverse.
+    __slots__ = (
+        "_left",
+        "_right",
+        "_id",
+    )
+
     def __init__(
         self, left: MetricConfiguration, right: Optional[MetricConfiguration] = None
     ) -> None:
         self._left = left
         self._right = right
+        # Edge id is hashed repeatedly during graph construction and resolution; hence, it is computed only once.
+        self._id: Tuple[Tuple[str, str, str], Optional[Tuple[str, str, str]]] = (
+            left.id,
+            None if right is None else right.id,
+        )
 
     @property
     def left(self):
@@ -55,10 +71,7 @@ class MetricEdge:
 
     @property
     def id(self):
-        if self.right:
-            return self.left.id, self.right.id
-
-        return self.left.id, None
+        return self._id
 
     def __repr__(self):
         return f"<{self._left.__repr__()}|{self._right.__repr__()}>"
@@ -72,12 +85,34 @@ class ValidationGraph:
     ) -> None:
         self._execution_engine = execution_engine
 
+        self._edges: List[MetricEdge] = []
+        self._edge_ids: Set[
+            Tuple[Tuple[str, str, str], Optional[Tuple[str, str, str]]]
+        ] = set()
+
+        # Indexes used by "_resolve()" to re-examine only metrics affected by those resolved in the previous round.
+        # Edges are indexed as precomputed "(left_id, right_id, left)" triples, sparing "_parse()" attribute lookups.
+        self._edge_tuples_by_left_id: Dict[
+            Tuple[str, str, str],
+            List[
+                Tuple[
+                    Tuple[str, str, str],
+                    Optional[Tuple[str, str, str]],
+                    MetricConfiguration,
+                ]
+            ],
+        ] = {}
+        self._left_ids_by_right_id: Dict[
+            Tuple[str, str, str], Set[Tuple[str, str, str]]
+        ] = {}
+
+        # Duplicate edges (e.g., shared by expectation-level sub-graphs being merged) are dropped.
         if edges:
-            self._edges = edges
-        else:
-            self._edges = []
+            self.extend_edges(edges=edges)
 
-        self._edge_ids = {edge.id for edge in self._edges}
+        # Dependencies of metrics (by id) already expanded by "build_metric_dependency_graph()"; kept on the graph,
+        # since that method is called once per top-level metric and such metrics share most of their dependencies.
+        self._expanded_metric_dependencies: Dict[Tuple[str, str, str], IDDict] = {}
 
     def __eq__(self, other) -> bool:
         """Supports comparing two "ValidationGraph" objects."""
@@ -89,15 +124,41 @@ class ValidationGraph:
         return self._edges
 
     @property
-    def edge_ids(self) -> Set[Tuple[str, str]]:
+    def edge_ids(
+        self,
+    ) -> Set[Tuple[Tuple[str, str, str], Optional[Tuple[str, str, str]]]]:
         """Returns "MetricEdge" objects, contained within this "ValidationGraph" object (as set of two-tuples)."""
-        return {edge.id for edge in self._edges}
+        return self._edge_ids
 
     def add(self, edge: MetricEdge) -> None:
         """Adds supplied "MetricEdge" object to this "ValidationGraph" object (if not already present)."""
         if edge.id not in self._edge_ids:
             self._edges.append(edge)
             self._edge_ids.add(edge.id)
+            self._index_edge(edge=edge)
+
+    def extend_edges(self, edges: Iterable[MetricEdge]) -> None:
+        """Adds supplied "MetricEdge" objects to this "ValidationGraph" object (skipping those already present)."""
+        edge: MetricEdge
+        new_edges_by_id: Dict[
+            Tuple[Tuple[str, str, str], Optional[Tuple[str, str, str]]], MetricEdge
+        ] = {}
+        for edge in edges:
+            if edge.id not in self._edge_ids:
+                new_edges_by_id.setdefault(edge.id, edge)
+
+        self._edges.extend(new_edges_by_id.values())
+        self._edge_ids.update(new_edges_by_id.keys())
+        for edge in new_edges_by_id.values():
+            self._index_edge(edge=edge)
+
+    def _index_edge(self, edge: MetricEdge) -> None:
+        left_id, right_id = edge.id
+        self._edge_tuples_by_left_id.setdefault(left_id, []).append(
+            (left_id, right_id, edge.left)
+        )
+        if right_id is not None:
+            self._left_ids_by_right_id.setdefault(right_id, set()).add(left_id)
 
     def build_metric_dependency_graph(
         self,
@@ -122,37 +183,69 @@ class ValidationGraph:
             metric_configuration=metric_configuration
         )
 
-        metric_dependencies = metric_impl_klass.get_evaluation_dependencies(
-            metric=metric_configuration,
-            execution_engine=self._execution_engine,
-            runtime_configuration=runtime_configuration,
-        )
-
-        if len(metric_dependencies) == 0:
-            self.add(
-                MetricEdge(
-                    left=metric_configuration,
-                )
+        # Iterative depth-first expansion; each metric (by id) has its dependencies evaluated at most once per graph.
+        # Defaults are applied to every dependency before its edge is added, so edge ids are final once recorded.
+        expanded_metric_dependencies: Dict[
+            Tuple[str, str, str], IDDict
+        ] = self._expanded_metric_dependencies
+        metric_configurations_to_expand: Deque[
+            Tuple[MetricConfiguration, MetricProvider]
+        ] = deque([(metric_configuration, metric_impl_klass)])
+
+        metric_dependency: MetricConfiguration
+        metric_dependency_impl_klass: MetricProvider
+        while metric_configurations_to_expand:
+            (
+                metric_configuration,
+                metric_impl_klass,
+            ) = metric_configurations_to_expand.pop()
+
+            if metric_configuration.id in expanded_metric_dependencies:
+                metric_configuration.metric_dependencies = expanded_metric_dependencies[
+                    metric_configuration.id
+                ]
+                continue
+
+            metric_dependencies = metric_impl_klass.get_evaluation_dependencies(
+                metric=metric_configuration,
+                execution_engine=self._execution_engine,
+                runtime_configuration=runtime_configuration,
             )
-        else:
-            metric_configuration.metric_dependencies = metric_dependencies
-            for metric_dependency in metric_dependencies.values():
-                # TODO: <Alex>In the future, provide a more robust cycle detection mechanism.</Alex>
-                if metric_dependency.id == metric_configuration.id:
-                    logger.warning(
-                        f"Metric {str(metric_configuration.id)} has created a circular dependency"
-                    )
-                    continue
+
+            if len(metric_dependencies) == 0:
+                expanded_metric_dependencies[metric_configuration.id] = IDDict({})
                 self.add(
                     MetricEdge(
                         left=metric_configuration,
-                        right=metric_dependency,
                     )
                 )
-                self.build_metric_dependency_graph(
-                    metric_configuration=metric_dependency,
-                    runtime_configuration=runtime_configuration,
-                )
+            else:
+                metric_configuration.metric_dependencies = metric_dependencies
+                expanded_metric_dependencies[
+                    metric_configuration.id
+                ] = metric_configuration.metric_dependencies
+                for metric_dependency in metric_dependencies.values():
+                    (
+                        metric_dependency_impl_klass,
+                        metric_provider,
+                    ) = self.set_metric_configuration_default_kwargs_if_absent(
+                        metric_configuration=metric_dependency
+                    )
+                    # TODO: <Alex>In the future, provide a more robust cycle detection mechanism.</Alex>
+                    if metric_dependency.id == metric_configuration.id:
+                        logger.warning(
+                            f"Metric {str(metric_configuration.id)} has created a circular dependency"
+                        )
+                        continue
+                    self.add(
+                        MetricEdge(
+                            left=metric_configuration,
+                            right=metric_dependency,
+                        )
+                    )
+                    metric_configurations_to_expand.append(
+                        (metric_dependency, metric_dependency_impl_klass)
+                    )
 
     def set_metric_configuration_default_kwargs_if_absent(
         self, metric_configuration: MetricConfiguration
@@ -236,51 +329,63 @@ class ValidationGraph:
             Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
         ] = {}
 
-        ready_metrics: Set[MetricConfiguration]
-        needed_metrics: Set[MetricConfiguration]
+        # Ready and needed metrics are keyed by their ids, which are thus computed only once per "_parse()" call.
+        ready_metrics: Dict[Tuple[str, str, str], MetricConfiguration]
+        needed_metrics: Dict[Tuple[str, str, str], MetricConfiguration]
 
         exception_info: ExceptionInfo
 
+        ready_metrics, needed_metrics = self._parse(metrics=metrics)
+
+        # Check to see if the user has disabled progress bars
+        disable = not show_progress_bars
+        if len(self.edges) < min_graph_edges_pbar_enable:
+            disable = True
+
+        # Importing "tqdm.auto" is deferred (and skipped altogether when progress bars are disabled) as it is costly.
         progress_bar: Optional[tqdm] = None
+        if not disable:
+            from tqdm.auto import tqdm as auto_tqdm
+
+            # noinspection PyProtectedMember,SpellCheckingInspection
+            progress_bar = auto_tqdm(
+                total=len(ready_metrics) + len(needed_metrics),
+                desc="Calculating Metrics",
+            )
+
+        resolved_metric_ids: Set[Tuple[str, str, str]]
 
         done: bool = False
         while not done:
-            ready_metrics, needed_metrics = self._parse(metrics=metrics)
-
-            # Check to see if the user has disabled progress bars
-            disable = not show_progress_bars
-            if len(self.edges) < min_graph_edges_pbar_enable:
-                disable = True
-
-            if progress_bar is None:
-                # noinspection PyProtectedMember,SpellCheckingInspection
-                progress_bar = tqdm(
-                    total=len(ready_metrics) + len(needed_metrics),
-                    desc="Calculating Metrics",
-                    disable=disable,
-                )
-            progress_bar.update(0)
-            progress_bar.refresh()
-
             computable_metrics = set()
 
-            for metric in ready_metrics:
-                if metric.id in failed_metric_info and failed_metric_info[metric.id]["num_failures"] >= MAX_METRIC_COMPUTATION_RETRIES:  # type: ignore[operator]  # Incorrect flagging of 'Unsupported operand types for <= ("int" and "MetricConfiguration") and for >= ("Set[ExceptionInfo]" and "int")' in deep "Union" structure.
-                    aborted_metrics_info[metric.id] = failed_metric_info[metric.id]
+            for metric_id, metric in ready_metrics.items():
+                if metric_id in failed_metric_info and failed_metric_info[metric_id]["num_failures"] >= MAX_METRIC_COMPUTATION_RETRIES:  # type: ignore[operator]  # Incorrect flagging of 'Unsupported operand types for <= ("int" and "MetricConfiguration") and for >= ("Set[ExceptionInfo]" and "int")' in deep "Union" structure.
+                    aborted_metrics_info[metric_id] = failed_metric_info[metric_id]
                 else:
                     computable_metrics.add(metric)
 
+            # Every round resolves one topological level of the graph (all metrics whose dependencies are resolved),
+            # which is as few engine calls as dependencies allow; an empty level means nothing is left to compute.
+            if not computable_metrics:
+                break
+
+            resolved_metric_ids = set()
+
             try:
                 # Access "ExecutionEngine.resolve_metrics()" method, to resolve missing "MetricConfiguration" objects.
-                metrics.update(
-                    self._execution_engine.resolve_metrics(
-                        metrics_to_resolve=computable_metrics,
-                        metrics=metrics,
-                        runtime_configuration=runtime_configuration,
-                    )
+                newly_resolved_metrics: Dict[
+                    Tuple[str, str, str], MetricValue
+                ] = self._execution_engine.resolve_metrics(
+                    metrics_to_resolve=computable_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
                 )
-                progress_bar.update(len(computable_metrics))
-                progress_bar.refresh()
+                metrics.update(newly_resolved_metrics)
+                resolved_metric_ids = set(newly_resolved_metrics.keys())
+                if progress_bar is not None:
+                    progress_bar.update(len(computable_metrics))
+                    progress_bar.refresh()
             except gx_exceptions.MetricResolutionError as err:
                 if catch_exceptions:
                     exception_traceback = traceback.format_exc()
@@ -289,19 +394,20 @@ class ValidationGraph:
                         exception_traceback=exception_traceback,
                         exception_message=exception_message,
                     )
+                    failed_metric_info_item: Dict[
+                        str, Union[MetricConfiguration, Set[ExceptionInfo], int]
+                    ]
                     for failed_metric in err.failed_metrics:
-                        if failed_metric.id in failed_metric_info:
-                            failed_metric_info[failed_metric.id]["num_failures"] += 1  # type: ignore[operator]  # Incorrect flagging of 'Unsupported operand types for <= ("int" and "MetricConfiguration") and for >= ("Set[ExceptionInfo]" and "int")' in deep "Union" structure.
-                            failed_metric_info[failed_metric.id]["exception_info"].add(exception_info)  # type: ignore[union-attr]  # Incorrect flagging of 'Item "MetricConfiguration" of "Union[MetricConfiguration, Set[ExceptionInfo], int]" has no attribute "add" and Item "int" of "Union[MetricConfiguration, Set[ExceptionInfo], int]" has no attribute "add"' in deep "Union" structure.
-                        else:
-                            failed_metric_info[failed_metric.id] = {}
-                            failed_metric_info[failed_metric.id][
-                                "metric_configuration"
-                            ] = failed_metric
-                            failed_metric_info[failed_metric.id]["num_failures"] = 1
-                            failed_metric_info[failed_metric.id]["exception_info"] = {
-                                exception_info
-                            }
+                        failed_metric_info_item = failed_metric_info.setdefault(
+                            failed_metric.id,
+                            {
+                                "metric_configuration": failed_metric,
+                                "num_failures": 0,
+                                "exception_info": set(),
+                            },
+                        )
+                        failed_metric_info_item["num_failures"] += 1  # type: ignore[operator]  # Incorrect flagging of 'Unsupported operand types for + ("MetricConfiguration" and "int") and ("Set[ExceptionInfo]" and "int")' in deep "Union" structure.
+                        failed_metric_info_item["exception_info"].add(exception_info)  # type: ignore[union-attr]  # Incorrect flagging of 'Item "MetricConfiguration" of "Union[MetricConfiguration, Set[ExceptionInfo], int]" has no attribute "add" and Item "int" of "Union[MetricConfiguration, Set[ExceptionInfo], int]" has no attribute "add"' in deep "Union" structure.
                 else:
                     raise err
             except Exception as e:
@@ -317,34 +423,105 @@ class ValidationGraph:
                 len(ready_metrics) == len(aborted_metrics_info)
             ):
                 done = True
+            else:
+                ready_metrics, needed_metrics = self._update_parse(
+                    metrics=metrics,
+                    ready_metrics=ready_metrics,
+                    needed_metrics=needed_metrics,
+                    resolved_metric_ids=resolved_metric_ids,
+                )
 
-        progress_bar.close()  # type: ignore[union-attr]  # Incorrect flagging of 'Item "None" of "Optional[Any]" has no attribute "close"' in external package.
+        if progress_bar is not None:
+            progress_bar.close()
 
         return aborted_metrics_info
 
     def _parse(
         self,
         metrics: Dict[Tuple[str, str, str], MetricValue],
-    ) -> Tuple[Set[MetricConfiguration], Set[MetricConfiguration]]:
+        left_ids: Optional[Iterable[Tuple[str, str, str]]] = None,
+    ) -> Tuple[
+        Dict[Tuple[str, str, str], MetricConfiguration],
+        Dict[Tuple[str, str, str], MetricConfiguration],
+    ]:
         """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
-        validation graph (a graph structure of metric ids) edges"""
-        unmet_dependency_ids = set()
-        unmet_dependency = set()
-        maybe_ready_ids = set()
-        maybe_ready = set()
-
-        for edge in self.edges:
-            if edge.left.id not in metrics:
-                if edge.right is None or edge.right.id in metrics:
-                    if edge.left.id not in maybe_ready_ids:
-                        maybe_ready_ids.add(edge.left.id)
-                        maybe_ready.add(edge.left)
-                else:
-                    if edge.left.id not in unmet_dependency_ids:
-                        unmet_dependency_ids.add(edge.left.id)
-                        unmet_dependency.add(edge.left)
+        validation graph (a graph structure of metric ids) edges (both keyed by metric id); if "left_ids" is given, only
+        edges emanating from metrics with these ids are traversed."""
+        if left_ids is None:
+            left_ids = self._edge_tuples_by_left_id.keys()
+
+        # Edges emanating from already resolved metrics are skipped as a group, rather than one edge at a time.
+        edge_tuples: Iterable[
+            Tuple[
+                Tuple[str, str, str],
+                Optional[Tuple[str, str, str]],
+                MetricConfiguration,
+            ]
+        ] = itertools.chain.from_iterable(
+            self._edge_tuples_by_left_id.get(left_id, [])
+            for left_id in left_ids
+            if left_id not in metrics
+        )
+
+        # Single pass: metric is ready unless any of its edges has unmet dependency, which then disqualifies it for good.
+        ready_metrics_by_id: Dict[Tuple[str, str, str], MetricConfiguration] = {}
+        needed_metrics_by_id: Dict[Tuple[str, str, str], MetricConfiguration] = {}
+
+        left_id: Tuple[str, str, str]
+        right_id: Optional[Tuple[str, str, str]]
+        left: MetricConfiguration
+        for left_id, right_id, left in edge_tuples:
+            if left_id in needed_metrics_by_id:
+                continue
 
-        return maybe_ready - unmet_dependency, unmet_dependency
+            if right_id is None or right_id in metrics:
+                if left_id not in ready_metrics_by_id:
+                    ready_metrics_by_id[left_id] = left
+            else:
+                needed_metrics_by_id[left_id] = left
+                ready_metrics_by_id.pop(left_id, None)
+
+        return ready_metrics_by_id, needed_metrics_by_id
+
+    def _update_parse(
+        self,
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+        ready_metrics: Dict[Tuple[str, str, str], MetricConfiguration],
+        needed_metrics: Dict[Tuple[str, str, str], MetricConfiguration],
+        resolved_metric_ids: Set[Tuple[str, str, str]],
+    ) -> Tuple[
+        Dict[Tuple[str, str, str], MetricConfiguration],
+        Dict[Tuple[str, str, str], MetricConfiguration],
+    ]:
+        """Updates ready and needed metrics, returned by "_parse()" in previous round, after "resolved_metric_ids" have
+        been added to "metrics"; only needed metrics that depend on these newly resolved metrics are re-examined."""
+        affected_metric_ids: Set[Tuple[str, str, str]] = set()
+        metric_id: Tuple[str, str, str]
+        for metric_id in resolved_metric_ids:
+            affected_metric_ids.update(
+                needed_metrics.keys() & self._left_ids_by_right_id.get(metric_id, set())
+            )
+
+        newly_ready_metrics: Dict[Tuple[str, str, str], MetricConfiguration]
+        still_needed_metrics: Dict[Tuple[str, str, str], MetricConfiguration]
+        newly_ready_metrics, still_needed_metrics = self._parse(
+            metrics=metrics, left_ids=affected_metric_ids
+        )
+
+        metric: MetricConfiguration
+        ready_metrics = {
+            metric_id: metric
+            for metric_id, metric in ready_metrics.items()
+            if metric_id not in metrics
+        }
+        ready_metrics.update(newly_ready_metrics)
+        needed_metrics = {
+            metric_id: metric
+            for metric_id, metric in needed_metrics.items()
+            if metric_id not in affected_metric_ids
+        }
+        needed_metrics.update(still_needed_metrics)
+        return ready_metrics, needed_metrics
 
     @staticmethod
     def _set_default_metric_kwargs_if_absent(
@@ -394,9 +571,7 @@ class ExpectationValidationGraph:
         return self._graph
 
     def update(self, graph: ValidationGraph) -> None:
-        edge: MetricEdge
-        for edge in graph.edges:
-            self.graph.add(edge=edge)
+        self.graph.extend_edges(edges=graph.edges)
 
     def get_exception_info(
         self,
@@ -427,13 +602,15 @@ class ExpectationValidationGraph:
         Tuple[str, str, str],
         Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
     ]:
-        graph_metric_ids: List[Tuple[str, str, str]] = []
         edge: MetricEdge
-        vertex: MetricConfiguration
-        for edge in self.graph.edges:
-            for vertex in [edge.left, edge.right]:
-                if vertex is not None:
-                    graph_metric_ids.append(vertex.id)
+        vertex_id: Optional[Tuple[str, str, str]]
+        # Precomputed edge ids are used, since computing "MetricConfiguration.id" requires hashing its kwargs.
+        graph_metric_ids: Set[Tuple[str, str, str]] = {
+            vertex_id
+            for edge in self.graph.edges
+            for vertex_id in edge.id
+            if vertex_id is not None
+        }
 
         metric_id: Tuple[str, str, str]
         metric_info_item: Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]]
@@ -387,6 +387,44 @@ def test_test_connection_failures(
     assert str(e.value) == str(test_connection_error)
 
 
+@pytest.mark.unit
+def test_test_connection_failures_are_combined_across_assets(
+    csv_path: pathlib.Path,
+    spark_filesystem_datasource: SparkFilesystemDatasource,
+):
+    batching_regex = re.compile(
+        r"green_tripdata_sample_(?P<year>\d{4})-(?P<month>\d{2})\.csv"
+    )
+    test_connection_errors: List[TestConnectionError] = []
+    assets: List[CSVAsset] = []
+    for asset_name in ("csv_asset_1", "csv_asset_2"):
+        csv_asset = CSVAsset(
+            name=asset_name,
+            batching_regex=batching_regex,
+        )
+        csv_asset._datasource = spark_filesystem_datasource
+        csv_asset._data_connector = FilesystemDataConnector(
+            datasource_name=spark_filesystem_datasource.name,
+            data_asset_name=csv_asset.name,
+            batching_regex=batching_regex,
+            base_directory=spark_filesystem_datasource.base_directory,
+            data_context_root_directory=spark_filesystem_datasource.data_context_root_directory,
+        )
+        test_connection_error = TestConnectionError(
+            f"""No file at base_directory path "{csv_path.resolve()}" matched regular expressions pattern "{batching_regex.pattern}" and/or glob_directive "**/*" for DataAsset "{asset_name}"."""
+        )
+        csv_asset._test_connection_error_message = test_connection_error
+        test_connection_errors.append(test_connection_error)
+        assets.append(csv_asset)
+
+    spark_filesystem_datasource.assets = assets
+
+    with pytest.raises(TestConnectionError) as e:
+        spark_filesystem_datasource.test_connection()
+
+    assert str(e.value) == "\n".join(str(error) for error in test_connection_errors)
+
+
 @pytest.mark.unit
 def test_get_batch_list_from_batch_request_does_not_modify_input_batch_request(
     spark_filesystem_datasource: SparkFilesystemDatasource,
@@ -1,5 +1,5 @@
 import sys
-from typing import Dict, Iterable, Optional, Set, Tuple, Union, cast
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union, cast
 from unittest import mock
 
 import pytest
@@ -148,6 +148,23 @@ def test_ValidationGraph_init_with_input_edges(
     assert graph.edge_ids == {e.id for e in edges}
 
 
+@pytest.mark.unit
+def test_ValidationGraph_init_with_duplicate_input_edges(
+    metric_edge: MetricEdge,
+) -> None:
+    class DummyExecutionEngine:
+        pass
+
+    execution_engine = cast(ExecutionEngine, DummyExecutionEngine)
+
+    graph = ValidationGraph(
+        execution_engine=execution_engine, edges=[metric_edge, metric_edge]
+    )
+
+    assert graph.edges == [metric_edge]
+    assert graph.edge_ids == {metric_edge.id}
+
+
 @pytest.mark.unit
 def test_ValidationGraph_add(metric_edge: MetricEdge) -> None:
     class DummyExecutionEngine:
@@ -166,6 +183,26 @@ def test_ValidationGraph_add(metric_edge: MetricEdge) -> None:
     assert metric_edge.id in graph.edge_ids
 
 
+@pytest.mark.unit
+def test_ValidationGraph_extend_edges(metric_edge: MetricEdge) -> None:
+    class DummyExecutionEngine:
+        pass
+
+    execution_engine = cast(ExecutionEngine, DummyExecutionEngine)
+
+    graph = ValidationGraph(execution_engine=execution_engine, edges=[metric_edge])
+
+    right_edge = MetricEdge(left=metric_edge.right)
+    graph.extend_edges(edges=[metric_edge, right_edge, right_edge])
+
+    assert graph.edges == [metric_edge, right_edge]
+    assert graph.edge_ids == {metric_edge.id, right_edge.id}
+    # Edges added in bulk take part in parsing just like those added one at a time.
+    ready_metrics, needed_metrics = graph._parse(metrics={})
+    assert set(ready_metrics.keys()) == {metric_edge.right.id}
+    assert set(needed_metrics.keys()) == {metric_edge.left.id}
+
+
 def test_ExpectationValidationGraph_constructor(
     expect_column_values_to_be_unique_expectation_config: ExpectationConfiguration,
     validation_graph_with_no_edges: ValidationGraph,
@@ -281,6 +318,28 @@ def test_parse_validation_graph(
     assert len(ready_metrics) == 2 and len(needed_metrics) == 9
 
 
+@pytest.mark.unit
+def test_parse_validation_graph_skips_resolved_metrics(
+    table_head_metric_config: MetricConfiguration,
+    column_histogram_metric_config: MetricConfiguration,
+    validation_graph_with_single_edge: ValidationGraph,
+):
+    validation_graph_with_single_edge.add(
+        MetricEdge(left=column_histogram_metric_config)
+    )
+
+    ready_metrics, needed_metrics = validation_graph_with_single_edge._parse(metrics={})
+    assert set(ready_metrics.keys()) == {column_histogram_metric_config.id}
+    assert set(needed_metrics.keys()) == {table_head_metric_config.id}
+
+    # Once resolved, a metric is neither ready nor needed, regardless of the state of its dependencies.
+    ready_metrics, needed_metrics = validation_graph_with_single_edge._parse(
+        metrics={table_head_metric_config.id: "my_value"}
+    )
+    assert set(ready_metrics.keys()) == {column_histogram_metric_config.id}
+    assert len(needed_metrics) == 0
+
+
 @pytest.mark.unit
 def test_populate_dependencies(
     expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,
@@ -293,6 +352,57 @@ def test_populate_dependencies(
     )
 
 
+@pytest.mark.unit
+def test_populate_dependencies_expands_shared_dependencies_once_per_graph():
+    class DummyExecutionEngine:
+        pass
+
+    execution_engine = cast(ExecutionEngine, DummyExecutionEngine)
+
+    table_row_count = MetricConfiguration(
+        metric_name="table.row_count",
+        metric_domain_kwargs={},
+    )
+    column_max = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "a"},
+    )
+    column_min = MetricConfiguration(
+        metric_name="column.min",
+        metric_domain_kwargs={"column": "a"},
+    )
+
+    def get_evaluation_dependencies(
+        metric: MetricConfiguration, **kwargs
+    ) -> Dict[str, MetricConfiguration]:
+        if metric.metric_name == "table.row_count":
+            return {}
+
+        return {"table.row_count": table_row_count}
+
+    metric_impl_klass = mock.MagicMock()
+    metric_impl_klass.get_evaluation_dependencies.side_effect = (
+        get_evaluation_dependencies
+    )
+
+    graph = ValidationGraph(execution_engine=execution_engine)
+    with mock.patch.object(
+        ValidationGraph,
+        "set_metric_configuration_default_kwargs_if_absent",
+        return_value=(metric_impl_klass, None),
+    ):
+        graph.build_metric_dependency_graph(metric_configuration=column_max)
+        graph.build_metric_dependency_graph(metric_configuration=column_min)
+
+    # "table.row_count" is shared by both top-level metrics, but is expanded only once.
+    assert metric_impl_klass.get_evaluation_dependencies.call_count == 3
+    assert graph.edge_ids == {
+        (column_max.id, table_row_count.id),
+        (column_min.id, table_row_count.id),
+        (table_row_count.id, None),
+    }
+
+
 @pytest.mark.unit
 def test_populate_dependencies_with_incorrect_metric_name():
     class PandasExecutionEngineStub:
@@ -397,6 +507,78 @@ def test_resolve_validation_graph_with_bad_config_catch_exceptions_true():
     )
 
 
+@pytest.mark.unit
+def test_resolve_validation_graph_resolves_metrics_in_dependency_order():
+    table_columns = MetricConfiguration(
+        metric_name="table.columns",
+        metric_domain_kwargs={},
+    )
+    table_row_count = MetricConfiguration(
+        metric_name="table.row_count",
+        metric_domain_kwargs={},
+    )
+    column_max = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "a"},
+    )
+    column_min = MetricConfiguration(
+        metric_name="column.min",
+        metric_domain_kwargs={"column": "a"},
+    )
+
+    resolution_rounds: List[Set[Tuple[str, str, str]]] = []
+
+    class ExecutionEngineFake:
+        # noinspection PyUnusedLocal
+        @staticmethod
+        def resolve_metrics(
+            metrics_to_resolve: Iterable[MetricConfiguration],
+            metrics: Optional[Dict[Tuple[str, str, str], MetricConfiguration]] = None,
+            runtime_configuration: Optional[dict] = None,
+        ) -> Dict[Tuple[str, str, str], MetricValue]:
+            resolution_rounds.append(
+                {metric_configuration.id for metric_configuration in metrics_to_resolve}
+            )
+            return {
+                metric_configuration.id: "my_value"
+                for metric_configuration in metrics_to_resolve
+            }
+
+    execution_engine = cast(ExecutionEngine, ExecutionEngineFake())
+
+    graph = ValidationGraph(
+        execution_engine=execution_engine,
+        edges=[
+            MetricEdge(left=table_columns),
+            MetricEdge(left=table_row_count),
+            MetricEdge(left=column_max, right=table_columns),
+            MetricEdge(left=column_min, right=table_columns),
+            MetricEdge(left=column_min, right=column_max),
+        ],
+    )
+
+    resolved_metrics: Dict[Tuple[str, str, str], MetricValue]
+    aborted_metrics_info: Dict[
+        Tuple[str, str, str],
+        Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
+    ]
+    resolved_metrics, aborted_metrics_info = graph.resolve(show_progress_bars=False)
+
+    # Each round resolves only metrics whose dependencies were resolved in earlier rounds.
+    assert resolution_rounds == [
+        {table_columns.id, table_row_count.id},
+        {column_max.id},
+        {column_min.id},
+    ]
+    assert set(resolved_metrics.keys()) == {
+        table_columns.id,
+        table_row_count.id,
+        column_max.id,
+        column_min.id,
+    }
+    assert aborted_metrics_info == {}
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize(
     "show_progress_bars, are_progress_bars_disabled, ",
@@ -421,7 +603,7 @@ def test_progress_bar_config(
     """
 
     class DummyMetricConfiguration:
-        pass
+        id = ("dummy_metric", "", "")
 
     class DummyExecutionEngine:
         pass
@@ -445,7 +627,7 @@ def test_progress_bar_config(
             MetricEdge(left=metric_configuration),
         ],
     ), mock.patch(
-        "great_expectations.validator.validation_graph.tqdm",
+        "tqdm.auto.tqdm",
     ) as mock_tqdm:
         call_args = {
             "runtime_configuration": None,
@@ -465,8 +647,8 @@ def test_progress_bar_config(
         ]
         # noinspection PyUnusedLocal
         resolved_metrics, aborted_metrics_info = graph.resolve(**call_args)
-        assert mock_tqdm.called is True
-        assert mock_tqdm.call_args[1]["disable"] is are_progress_bars_disabled
+        # Progress bar is only constructed when it is enabled.
+        assert mock_tqdm.called is not are_progress_bars_disabled
 
 
 if __name__ == "__main__":